@@ -1,10 +1,13 @@
+import hashlib
 import html
-import json
 import logging
+import operator
 import re
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, Callable, TYPE_CHECKING
 from pathlib import Path
 
+import orjson
+
 from .config import config
 from .flight_state import Phase, CHECKLIST_PHASES, PHASE_DISPLAY, get_next_checklist_phase, get_prev_checklist_phase
 
@@ -13,16 +16,56 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Verify condition name -> comparison function
+_VERIFY_CONDITIONS = {
+    "eq": operator.eq,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "lt": operator.lt,
+}
+
+# Marker for "no SimConnect value evaluated yet"
+_UNSET = object()
+
+# Checklist item id -> (FlightPlan attribute, SimBrief value type)
+_SIMBRIEF_ITEM_FIELDS: dict[str, tuple[str, str]] = {
+    "fuel": ("fuel_block", "fuel"),
+    "baro_ref": ("origin_qnh", "baro"),
+    "baro_ref_ldg": ("dest_qnh", "baro"),
+    "baro_ref_desc": ("dest_qnh", "baro"),
+    "pitch_trim": ("trim_percent", "trim"),
+}
+
+# SimBrief value type -> display formatter
+_SIMBRIEF_FORMATTERS: dict[str, Callable[[Any], str]] = {
+    "fuel": lambda value: f"{value:,} ",
+    "baro": lambda value: f"{value} ",
+    "trim": lambda value: f"{value:.1f}",
+}
+
 
 class ChecklistItem:
     """Represents a single checklist item."""
 
+    __slots__ = (
+        "id", "challenge", "response", "response_template", "verify",
+        "verify_compare", "verify_expected", "verify_last_value", "checked", "verified",
+        "simbrief_value", "simbrief_type",
+    )
+
     def __init__(self, data: dict):
         self.id = data["id"]
         self.challenge = data["challenge"]
         self.response = data["response"]
         self.response_template = data["response"]  # Original template with placeholders
         self.verify = data.get("verify")  # Auto-verify config
+        # Cached verify fields so the polling path avoids repeated dict lookups
+        self.verify_compare: Optional[Callable[[Any, Any], bool]] = (
+            _VERIFY_CONDITIONS.get(self.verify.get("condition")) if self.verify else None
+        )
+        self.verify_expected: Any = self.verify.get("value") if self.verify else None
+        self.verify_last_value: Any = _UNSET  # Last SimConnect value evaluated
         self.checked = False  # Pilot acknowledged
         self.verified: Optional[bool] = None  # Sim verified (None if not verifiable)
         # SimBrief expected values (for comparison with MSFS actual)
@@ -43,6 +86,7 @@ class ChecklistItem:
     def reset(self):
         self.checked = False
         self.verified = None
+        self.verify_last_value = _UNSET
         self.response = self.response_template
         self.simbrief_value = None
         self.simbrief_type = None
@@ -51,32 +95,41 @@ class ChecklistItem:
 class Checklist:
     """Represents a checklist for a specific phase."""
 
+    __slots__ = ("id", "title", "trigger", "items", "_by_id", "_dict_cache")
+
     def __init__(self, data: dict):
         self.id = data["id"]
         self.title = data["title"]
         self.trigger = data.get("trigger", "")
         self.items = [ChecklistItem(item) for item in data["items"]]
+        self._by_id = {item.id: item for item in self.items}
+        self._dict_cache: Optional[dict] = None
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "trigger": self.trigger,
-            "items": [item.to_dict() for item in self.items],
-        }
+        """Serialize the checklist. Cached until invalidate() is called."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "title": self.title,
+                "trigger": self.trigger,
+                "items": [item.to_dict() for item in self.items],
+            }
+        return self._dict_cache
+
+    def invalidate(self):
+        """Drop the cached to_dict() result after an item was mutated."""
+        self._dict_cache = None
 
     def reset(self):
         for item in self.items:
             item.reset()
+        self._dict_cache = None
 
     def is_complete(self) -> bool:
         return all(item.checked for item in self.items)
 
     def get_item(self, item_id: str) -> Optional[ChecklistItem]:
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        return None
+        return self._by_id.get(item_id)
 
 
 class ChecklistManager:
@@ -85,35 +138,63 @@ class ChecklistManager:
     # Maximum phase history entries to retain
     _MAX_PHASE_HISTORY = 20
 
+    # Top-level sections of the checklist file, in flight order
+    _PHASE_SECTIONS = ("departure", "after_takeoff", "cruise", "descent", "arrival")
+
     def __init__(self, training_mode: bool = False):
         self.checklists: dict[str, Checklist] = {}
         self.current_phase: Phase = Phase.COCKPIT_PREPARATION
-        self.phase_mode: str = "auto"  # "auto" or "manual"
+        self._phase_mode: str = "auto"  # "auto" or "manual"
         self.phase_history: list[str] = []
         self.training_mode: bool = training_mode
         self._state_version: int = 0
+        # (checklist, item) pairs so mutations can invalidate the owning checklist
+        self._verify_index: dict[str, list[tuple[Checklist, ChecklistItem]]] = {}
+        self._placeholder_items: list[tuple[Checklist, ChecklistItem]] = []
+        # SimConnect state version the verifications were last computed from
+        self.verified_source_version: Optional[int] = None
+        # (state_version, body, etag) for the serialized /api/checklist payload
+        self._all_checklists_cache: Optional[tuple[int, bytes, str]] = None
         self._load_checklists()
 
+    @property
+    def state_version(self) -> int:
+        return self._state_version
+
+    @property
+    def phase_mode(self) -> str:
+        return self._phase_mode
+
+    @phase_mode.setter
+    def phase_mode(self, mode: str):
+        # Part of the served state, so a change must bump the version (ETags, client renders)
+        if mode != self._phase_mode:
+            self._phase_mode = mode
+            self._state_version += 1
+
     def _load_checklists(self):
         """Load checklists from JSON file based on training mode."""
         checklist_file = config.TRAINING_CHECKLIST_FILE if self.training_mode else config.CHECKLIST_FILE
         try:
-            with open(checklist_file, "r") as f:
-                data = json.load(f)
+            with open(checklist_file, "rb") as f:
+                data = orjson.loads(f.read())
         except FileNotFoundError:
             logger.error(f"Checklist file not found: {checklist_file}")
             return
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in checklist file {checklist_file}: {e}")
             return
 
         try:
             # Load all phase sections
-            for section in ("departure", "after_takeoff", "cruise", "descent", "arrival"):
-                for checklist_data in data["phases"].get(section, []):
+            phases = data["phases"]
+            for section in self._PHASE_SECTIONS:
+                for checklist_data in phases.get(section, ()):
                     checklist = Checklist(checklist_data)
                     self.checklists[checklist.id] = checklist
 
+            self._build_item_indexes()
+
             mode_str = "training" if self.training_mode else "normal"
             logger.info(f"Loaded {len(self.checklists)} checklists ({mode_str} mode)")
 
@@ -121,16 +202,31 @@ class ChecklistManager:
             logger.error(f"Failed to load checklists: {e}")
             raise
 
+    def _build_item_indexes(self):
+        """Index verifiable items by SimConnect variable and collect placeholder items."""
+        self._verify_index = {}
+        self._placeholder_items = []
+        for checklist in self.checklists.values():
+            for item in checklist.items:
+                if item.verify and item.verify.get("var"):
+                    self._verify_index.setdefault(item.verify["var"], []).append((checklist, item))
+                if "___" in item.response_template:
+                    self._placeholder_items.append((checklist, item))
+
     def set_training_mode(self, enabled: bool):
         """Switch between training and normal checklists."""
         if self.training_mode != enabled:
             self.training_mode = enabled
             self.checklists.clear()
+            self._verify_index = {}
+            self._placeholder_items = []
+            self.verified_source_version = None
             self._load_checklists()
             # Reset to first phase
             self.current_phase = Phase.COCKPIT_PREPARATION
             self.phase_mode = "auto"
             self.phase_history = []
+            self._state_version += 1
             logger.info(f"Switched to {'training' if enabled else 'normal'} checklists")
 
     def get_current_checklist(self) -> Optional[Checklist]:
@@ -178,6 +274,7 @@ class ChecklistManager:
             item = checklist.get_item(item_id)
             if item:
                 item.checked = True
+                checklist.invalidate()
                 self._state_version += 1
                 return True
         return False
@@ -189,6 +286,7 @@ class ChecklistManager:
             item = checklist.get_item(item_id)
             if item:
                 item.checked = False
+                checklist.invalidate()
                 self._state_version += 1
                 return True
         return False
@@ -200,6 +298,7 @@ class ChecklistManager:
             item = checklist.get_item(item_id)
             if item:
                 item.checked = not item.checked
+                checklist.invalidate()
                 self._state_version += 1
                 return True
         return False
@@ -208,35 +307,44 @@ class ChecklistManager:
         """Reset all checklists to unchecked."""
         for checklist in self.checklists.values():
             checklist.reset()
+        self.verified_source_version = None
         self.current_phase = Phase.COCKPIT_PREPARATION
         self.phase_mode = "auto"
         self.phase_history = []
         self._state_version += 1
         logger.info("All checklists reset")
 
+    def _apply_verification(self, var_name: str, value: Any) -> bool:
+        """Re-verify items bound to a variable. Returns True if any item changed."""
+        changed = False
+        for checklist, item in self._verify_index.get(var_name, ()):
+            compare = item.verify_compare
+            if compare is None or item.verify_last_value == value:
+                continue
+            item.verify_last_value = value
+            verified = compare(value, item.verify_expected)
+            if verified != item.verified:
+                item.verified = verified
+                checklist.invalidate()
+                changed = True
+        return changed
+
     def update_verification(self, var_name: str, value: Any):
         """Update auto-verification status based on SimConnect variable."""
+        if self._apply_verification(var_name, value):
+            self._state_version += 1
+
+    def update_verifications(self, updates: dict[str, Any], source_version: Optional[int] = None):
+        """Update auto-verification for a batch of SimConnect variables at once.
+
+        source_version records which SimConnect state the values came from, so
+        callers can skip the pass while the state is unchanged.
+        """
+        self.verified_source_version = source_version
         changed = False
-        for checklist in self.checklists.values():
-            for item in checklist.items:
-                if item.verify and item.verify.get("var") == var_name:
-                    condition = item.verify.get("condition")
-                    expected = item.verify.get("value")
-                    old_verified = item.verified
-
-                    if condition == "eq":
-                        item.verified = (value == expected)
-                    elif condition == "gte":
-                        item.verified = (value >= expected)
-                    elif condition == "lte":
-                        item.verified = (value <= expected)
-                    elif condition == "gt":
-                        item.verified = (value > expected)
-                    elif condition == "lt":
-                        item.verified = (value < expected)
-
-                    if item.verified != old_verified:
-                        changed = True
+        for var_name, value in updates.items():
+            if self._apply_verification(var_name, value):
+                changed = True
         if changed:
             self._state_version += 1
 
@@ -247,15 +355,24 @@ class ChecklistManager:
             for phase_id, checklist in self.checklists.items()
         }
 
+    def get_all_checklists_json(self) -> tuple[bytes, str]:
+        """Serialized get_all_checklists() and its ETag, cached per state version."""
+        cache = self._all_checklists_cache
+        if cache is None or cache[0] != self._state_version:
+            body = orjson.dumps(self.get_all_checklists())
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            cache = self._all_checklists_cache = (self._state_version, body, etag)
+        return cache[1], cache[2]
+
     def get_state_dict(self) -> dict:
         """Get the current state as a dict for API/WebSocket."""
         current_checklist = self.get_current_checklist()
         return {
             "phase": self.current_phase.value,
-            "phase_display": PHASE_DISPLAY.get(self.current_phase, self.current_phase.value),
+            "phase_display": PHASE_DISPLAY[self.current_phase],
             "phase_mode": self.phase_mode,
             "checklist": current_checklist.to_dict() if current_checklist else None,
-            "phase_history": self.phase_history,
+            "phase_history": list(self.phase_history),  # Snapshot; set_phase appends in place
             "state_version": self._state_version,
         }
 
@@ -268,64 +385,28 @@ class ChecklistManager:
         if not flight_plan:
             return
 
-        # Store raw values and types for MSFS comparison
-        simbrief_data = {
-            "fuel": {
-                "value": flight_plan.fuel_block,
-                "type": "fuel",
-                "units": flight_plan.fuel_units,
-            },
-            "baro_ref": {
-                "value": flight_plan.origin_qnh,
-                "type": "baro",
-                "units": "hPa",
-            },
-            "baro_ref_ldg": {
-                "value": flight_plan.dest_qnh,
-                "type": "baro",
-                "units": "hPa",
-            },
-            "baro_ref_desc": {
-                "value": flight_plan.dest_qnh,
-                "type": "baro",
-                "units": "hPa",
-            },
-            "pitch_trim": {
-                "value": flight_plan.trim_percent,
-                "type": "trim",
-                "units": "%",
-            },
-        }
-
-        for checklist in self.checklists.values():
-            for item in checklist.items:
-                # Check if response has a placeholder
-                if "___" not in item.response_template:
-                    continue
-
-                # Get SimBrief data for this item
-                sb_data = simbrief_data.get(item.id)
-                if not sb_data or not sb_data["value"]:
-                    continue
-
-                # Store SimBrief value and type for frontend use
-                item.simbrief_value = str(sb_data["value"])
-                item.simbrief_type = sb_data["type"]
-
-                # Format display value based on type
-                if sb_data["type"] == "fuel":
-                    display_val = f"{sb_data['value']:,} "
-                elif sb_data["type"] == "baro":
-                    display_val = f"{sb_data['value']} "
-                elif sb_data["type"] == "trim":
-                    display_val = f"{sb_data['value']:.1f}"
-                else:
-                    display_val = str(sb_data["value"])
-
-                # Wrap in span for styling (simbrief-value class)
-                display_val = html.escape(str(display_val))
-                styled_val = f'<span class="simbrief-value">{display_val}</span>'
-                item.response = item.response_template.replace("___", styled_val)
+        for checklist, item in self._placeholder_items:
+            # Get SimBrief field for this item
+            field = _SIMBRIEF_ITEM_FIELDS.get(item.id)
+            if not field:
+                continue
+            attr, sb_type = field
+            value = getattr(flight_plan, attr)
+            if not value:
+                continue
+
+            # Store SimBrief value and type for frontend use (MSFS comparison)
+            item.simbrief_value = str(value)
+            item.simbrief_type = sb_type
+
+            # Format display value based on type
+            display_val = html.escape(_SIMBRIEF_FORMATTERS[sb_type](value))
+
+            # Wrap in span for styling (simbrief-value class)
+            styled_val = f'<span class="simbrief-value">{display_val}</span>'
+            item.response = item.response_template.replace("___", styled_val)
+            checklist.invalidate()
+        self._state_version += 1
 
         logger.info("Flight plan data injected into checklists")
 
@@ -336,4 +417,6 @@ class ChecklistManager:
                 item.response = item.response_template
                 item.simbrief_value = None
                 item.simbrief_type = None
+            checklist.invalidate()
+        self._state_version += 1
         logger.info("Flight plan data cleared from checklists")
@@ -16,6 +16,8 @@ class Config:
     # Server settings
     HOST: str = "0.0.0.0"
     PORT: int = 2549  # RFC 2549 - IP over Avian Carriers
+    WS_MAX_SIZE: int = 64 * 1024  # Bytes; clients only send small control messages
+    GZIP_MIN_SIZE: int = 500  # Bytes; smaller responses are sent uncompressed
 
     # SimConnect settings
     SIMCONNECT_ENABLED: bool = True
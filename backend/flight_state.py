@@ -1,11 +1,16 @@
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel
 
 # Named constants for magic numbers
 N1_RPM_SCALE = 163.84
+N1_RPM_SCALE_INV = 1.0 / N1_RPM_SCALE
 N1_RUNNING_THRESHOLD = 15
 CRUISE_ALT_THRESHOLD = 10000
+# Approach requires being clearly below the cruise threshold, so altimeter noise
+# while levelling off around 10,000 ft does not trigger it prematurely
+ALT_HYSTERESIS_FT = 500
+APPROACH_ALT_THRESHOLD = CRUISE_ALT_THRESHOLD - ALT_HYSTERESIS_FT
 APPROACH_AGL_THRESHOLD = 1000
 TAXI_SPEED_KTS = 10
 LANDING_SPEED_KTS = 30
@@ -35,8 +40,8 @@ class Phase(str, Enum):
     SECURING = "securing"
 
 
-# Phases that have associated checklists
-CHECKLIST_PHASES = [
+# Phases that have associated checklists (immutable, in flight order)
+CHECKLIST_PHASES = (
     Phase.COCKPIT_PREPARATION,
     Phase.BEFORE_START,
     Phase.AFTER_START,
@@ -50,7 +55,14 @@ CHECKLIST_PHASES = [
     Phase.AFTER_LANDING,
     Phase.PARKING,
     Phase.SECURING,
-]
+)
+
+# Same phases as a set, for membership tests
+CHECKLIST_PHASES_SET = frozenset(CHECKLIST_PHASES)
+
+# Neighbouring checklist phases, precomputed from CHECKLIST_PHASES
+_NEXT_CHECKLIST_PHASE = dict(zip(CHECKLIST_PHASES, CHECKLIST_PHASES[1:]))
+_PREV_CHECKLIST_PHASE = dict(zip(CHECKLIST_PHASES[1:], CHECKLIST_PHASES))
 
 # Phase display names
 PHASE_DISPLAY = {
@@ -68,10 +80,17 @@ PHASE_DISPLAY = {
     Phase.PARKING: "PARKING",
     Phase.SECURING: "SECURING",
 }
+# Fill in any phase without a display name so lookups never need a fallback
+PHASE_DISPLAY = {phase: PHASE_DISPLAY.get(phase, phase.value) for phase in Phase}
+
 
+@dataclass(slots=True)
+class FlightState:
+    """Current state of the aircraft from SimConnect.
 
-class FlightState(BaseModel):
-    """Current state of the aircraft from SimConnect."""
+    A plain slotted dataclass rather than a pydantic model: it is rebuilt on
+    every SimConnect poll and its values are already converted by the client.
+    """
 
     # Core state
     sim_on_ground: bool = True
@@ -125,6 +144,11 @@ class FlightState(BaseModel):
     # Electrical
     master_battery: bool = False  # Master battery switch
 
+    def to_dict(self) -> dict:
+        """Serialize the state for API/WebSocket."""
+        # __slots__ holds the field names, in declaration order
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class PhaseDetector:
     """State machine for flight phase detection. Only progresses forward automatically."""
@@ -137,81 +161,95 @@ class PhaseDetector:
         return self._current_phase
 
     def _engines_running(self, state: FlightState) -> bool:
-        """Check if any engine is running."""
-        eng1_n1 = max(state.eng1_n1, state.eng1_n1_rpm / N1_RPM_SCALE if state.eng1_n1_rpm else 0)
-        eng2_n1 = max(state.eng2_n1, state.eng2_n1_rpm / N1_RPM_SCALE if state.eng2_n1_rpm else 0)
-        return eng1_n1 > N1_RUNNING_THRESHOLD or eng2_n1 > N1_RUNNING_THRESHOLD or state.eng1_combustion or state.eng2_combustion
+        """Check if any engine is running. Cheapest signals are checked first."""
+        if state.eng1_combustion or state.eng2_combustion:
+            return True
+        if state.eng1_n1 > N1_RUNNING_THRESHOLD or state.eng2_n1 > N1_RUNNING_THRESHOLD:
+            return True
+        return (
+            state.eng1_n1_rpm * N1_RPM_SCALE_INV > N1_RUNNING_THRESHOLD
+            or state.eng2_n1_rpm * N1_RPM_SCALE_INV > N1_RUNNING_THRESHOLD
+        )
+
+    # Forward transitions: each returns the next phase, or None to stay put.
+    # PARKING and SECURING have no automatic transition (manual advance only).
+
+    def _from_cockpit_preparation(self, state: FlightState) -> Optional[Phase]:
+        # Advance when beacon on (ready for pushback)
+        return Phase.BEFORE_START if state.light_beacon else None
+
+    def _from_before_start(self, state: FlightState) -> Optional[Phase]:
+        # Advance when engines start
+        return Phase.AFTER_START if self._engines_running(state) else None
+
+    def _from_after_start(self, state: FlightState) -> Optional[Phase]:
+        # Advance when taxi speed reached
+        return Phase.TAXI if state.ground_velocity >= TAXI_SPEED_KTS else None
+
+    def _from_taxi(self, state: FlightState) -> Optional[Phase]:
+        # Advance when landing lights on (entering runway)
+        return Phase.LINE_UP if state.light_landing else None
+
+    def _from_line_up(self, state: FlightState) -> Optional[Phase]:
+        # Advance when airborne
+        return Phase.AFTER_TAKEOFF if not state.sim_on_ground else None
+
+    def _from_after_takeoff(self, state: FlightState) -> Optional[Phase]:
+        # Advance when reaching cruise altitude (above 10,000 ft MSL and level)
+        if (state.altitude_msl > CRUISE_ALT_THRESHOLD
+                and -LEVEL_VS_THRESHOLD < state.vertical_speed < LEVEL_VS_THRESHOLD):
+            return Phase.CRUISE
+        return None
+
+    def _from_cruise(self, state: FlightState) -> Optional[Phase]:
+        # Advance to descent when descending and still above 10,000 ft
+        if state.vertical_speed < DESCENT_VS_THRESHOLD and state.altitude_msl > CRUISE_ALT_THRESHOLD:
+            return Phase.DESCENT
+        return None
+
+    def _from_descent(self, state: FlightState) -> Optional[Phase]:
+        # Advance to approach when descending below 9,500 ft MSL (10,000 ft less hysteresis)
+        if 0 < state.altitude_msl < APPROACH_ALT_THRESHOLD:
+            return Phase.APPROACH
+        return None
+
+    def _from_approach(self, state: FlightState) -> Optional[Phase]:
+        # Advance when below 1000 ft AGL (use AGL for final approach)
+        return Phase.LANDING if state.altitude_agl < APPROACH_AGL_THRESHOLD else None
+
+    def _from_landing(self, state: FlightState) -> Optional[Phase]:
+        # Advance when on ground and slowed down
+        if state.sim_on_ground and state.ground_velocity < LANDING_SPEED_KTS:
+            return Phase.AFTER_LANDING
+        return None
+
+    def _from_after_landing(self, state: FlightState) -> Optional[Phase]:
+        # Advance when stopped and engines off
+        if state.ground_velocity < PARKING_SPEED_KTS and not self._engines_running(state):
+            return Phase.PARKING
+        return None
+
+    _TRANSITIONS = {
+        Phase.COCKPIT_PREPARATION: _from_cockpit_preparation,
+        Phase.BEFORE_START: _from_before_start,
+        Phase.AFTER_START: _from_after_start,
+        Phase.TAXI: _from_taxi,
+        Phase.LINE_UP: _from_line_up,
+        Phase.AFTER_TAKEOFF: _from_after_takeoff,
+        Phase.CRUISE: _from_cruise,
+        Phase.DESCENT: _from_descent,
+        Phase.APPROACH: _from_approach,
+        Phase.LANDING: _from_landing,
+        Phase.AFTER_LANDING: _from_after_landing,
+    }
 
     def detect(self, state: FlightState) -> Phase:
         """Check if we should advance to the next phase. Never goes backward."""
-        engines_running = self._engines_running(state)
-        ground_speed = state.ground_velocity
-        on_ground = state.sim_on_ground
-
-        # State machine - only forward transitions
-        if self._current_phase == Phase.COCKPIT_PREPARATION:
-            # Advance when beacon on (ready for pushback)
-            if state.light_beacon:
-                self._current_phase = Phase.BEFORE_START
-
-        elif self._current_phase == Phase.BEFORE_START:
-            # Advance when engines start
-            if engines_running:
-                self._current_phase = Phase.AFTER_START
-
-        elif self._current_phase == Phase.AFTER_START:
-            # Advance when taxi speed reached
-            if ground_speed >= TAXI_SPEED_KTS:
-                self._current_phase = Phase.TAXI
-
-        elif self._current_phase == Phase.TAXI:
-            # Advance when landing lights on (entering runway)
-            if state.light_landing:
-                self._current_phase = Phase.LINE_UP
-
-        elif self._current_phase == Phase.LINE_UP:
-            # Advance when airborne
-            if not on_ground:
-                self._current_phase = Phase.AFTER_TAKEOFF
-
-        elif self._current_phase == Phase.AFTER_TAKEOFF:
-            # Advance when reaching cruise altitude (above 10,000 ft MSL and level)
-            if state.altitude_msl > CRUISE_ALT_THRESHOLD and abs(state.vertical_speed) < LEVEL_VS_THRESHOLD:
-                self._current_phase = Phase.CRUISE
-
-        elif self._current_phase == Phase.CRUISE:
-            # Advance to descent when descending and still above 10,000 ft
-            if state.vertical_speed < DESCENT_VS_THRESHOLD and state.altitude_msl > CRUISE_ALT_THRESHOLD:
-                self._current_phase = Phase.DESCENT
-
-        elif self._current_phase == Phase.DESCENT:
-            # Advance to approach when descending below 10,000 ft MSL
-            if state.altitude_msl > 0 and state.altitude_msl < CRUISE_ALT_THRESHOLD:
-                self._current_phase = Phase.APPROACH
-
-        elif self._current_phase == Phase.APPROACH:
-            # Advance when below 1000 ft AGL (use AGL for final approach)
-            if state.altitude_agl < APPROACH_AGL_THRESHOLD:
-                self._current_phase = Phase.LANDING
-
-        elif self._current_phase == Phase.LANDING:
-            # Advance when on ground and slowed down
-            if on_ground and ground_speed < LANDING_SPEED_KTS:
-                self._current_phase = Phase.AFTER_LANDING
-
-        elif self._current_phase == Phase.AFTER_LANDING:
-            # Advance when stopped and engines off
-            if ground_speed < PARKING_SPEED_KTS and not engines_running:
-                self._current_phase = Phase.PARKING
-
-        elif self._current_phase == Phase.PARKING:
-            # Advance when securing (manual or auto)
-            pass  # Stay here until manual advance
-
-        elif self._current_phase == Phase.SECURING:
-            # Final state
-            pass
-
+        transition = self._TRANSITIONS.get(self._current_phase)
+        if transition:
+            next_phase = transition(self, state)
+            if next_phase:
+                self._current_phase = next_phase
         return self._current_phase
 
     def reset(self):
@@ -229,21 +267,9 @@ class PhaseDetector:
 
 def get_next_checklist_phase(current: Phase) -> Optional[Phase]:
     """Get the next checklist phase after the current one."""
-    try:
-        idx = CHECKLIST_PHASES.index(current)
-        if idx < len(CHECKLIST_PHASES) - 1:
-            return CHECKLIST_PHASES[idx + 1]
-    except ValueError:
-        pass
-    return None
+    return _NEXT_CHECKLIST_PHASE.get(current)
 
 
 def get_prev_checklist_phase(current: Phase) -> Optional[Phase]:
     """Get the previous checklist phase before the current one."""
-    try:
-        idx = CHECKLIST_PHASES.index(current)
-        if idx > 0:
-            return CHECKLIST_PHASES[idx - 1]
-    except ValueError:
-        pass
-    return None
+    return _PREV_CHECKLIST_PHASE.get(current)
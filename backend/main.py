@@ -1,14 +1,19 @@
 import asyncio
 import logging
+import os
+import socket
 from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+import orjson
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel
 
 from .config import config
-from .flight_state import FlightState, Phase, PhaseDetector, CHECKLIST_PHASES
+from .flight_state import FlightState, Phase, PhaseDetector, CHECKLIST_PHASES_SET
 from .simconnect_client import SimConnectClient
 from .checklist_manager import ChecklistManager
 from .websocket_manager import WebSocketManager
@@ -33,7 +38,7 @@ websocket_manager = WebSocketManager()
 phase_detector = PhaseDetector()
 
 # Verification variables to monitor
-VERIFY_VARS = [
+VERIFY_VARS = (
     "BRAKE_PARKING_POSITION",
     "LIGHT_BEACON",
     "TRAILING_EDGE_FLAPS_LEFT_PERCENT",
@@ -49,46 +54,58 @@ VERIFY_VARS = [
     "LIGHT_NAV",
     "LIGHT_STROBE",
     "ELECTRICAL_MASTER_BATTERY",
-]
+)
+
+# Distinguishes /api/state ETags across restarts, when both version counters start over
+STATE_ETAG_PREFIX = os.urandom(4).hex()
+
+
+def current_state() -> dict:
+    """Build the data payload of a WebSocket state_update message."""
+    data = checklist_manager.get_state_dict()  # Fresh dict, safe to extend in place
+    data["connected"] = simconnect.connected
+    data["flight_state"] = simconnect.get_state_dict() if simconnect.connected else None
+    data["auto_transition"] = config.AUTO_PHASE_TRANSITION
+    data["flight_plan"] = simbrief_client.flight_plan_dict
+    return data
+
+
+def get_local_ip() -> str:
+    """Get the local network IP address (blocking, up to 2 seconds)."""
+    try:
+        # Get local IP by connecting to an external address (doesn't actually connect)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(2)
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+    except Exception:
+        local_ip = "localhost"
+    return local_ip
+
+
+async def broadcast_item_update(phase_id: str, item_id: str):
+    """Broadcast one item's checked state instead of the full state."""
+    item = checklist_manager.get_checklist(phase_id).get_item(item_id)
+    await websocket_manager.send_item_update(phase_id, item_id, item.checked)
 
 
 async def on_state_update(state: FlightState):
     """Called when SimConnect state updates."""
-    # Update verification status for checklist items
-    for var in VERIFY_VARS:
-        value = simconnect.get_variable(var)
-        if value is not None:
-            checklist_manager.update_verification(var, value)
+    # Update verification status for checklist items, unless the sim state is unchanged
+    if checklist_manager.verified_source_version != simconnect.state_version:
+        checklist_manager.update_verifications(
+            simconnect.get_variables(VERIFY_VARS), simconnect.state_version
+        )
 
     # Auto-detect phase if in auto mode
     if checklist_manager.phase_mode == "auto" and config.AUTO_PHASE_TRANSITION:
         detected = phase_detector.detect(state)
         # Only change to phases that have checklists
-        if detected in CHECKLIST_PHASES:
+        if detected != checklist_manager.current_phase and detected in CHECKLIST_PHASES_SET:
             checklist_manager.set_phase(detected)
 
     # Broadcast state to all WebSocket clients
-    await websocket_manager.send_state_update(
-        connected=simconnect.connected,
-        flight_state=state.model_dump() if simconnect.connected else None,
-        checklist_state=checklist_manager.get_state_dict(),
-        auto_transition=config.AUTO_PHASE_TRANSITION,
-        flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-    )
-
-
-async def periodic_broadcast():
-    """Periodically broadcast state even when SimConnect is not connected."""
-    while True:
-        if not simconnect.connected:
-            await websocket_manager.send_state_update(
-                connected=False,
-                flight_state=None,
-                checklist_state=checklist_manager.get_state_dict(),
-                auto_transition=config.AUTO_PHASE_TRANSITION,
-                flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-            )
-        await asyncio.sleep(1.0)
+    websocket_manager.request_state_update()
 
 
 @asynccontextmanager
@@ -96,12 +113,18 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     logger.info("Starting MSFS Checklist Companion...")
 
-    # Set up state callback
+    # Resolve the LAN address once for the QR code, off the event loop
+    app.state.local_ip = await asyncio.get_running_loop().run_in_executor(None, get_local_ip)
+
+    # Set up state callback and WebSocket state source
     simconnect.set_state_callback(on_state_update)
+    websocket_manager.set_state_provider(current_state)
 
-    # Start SimConnect polling in background
+    # Start SimConnect polling and WebSocket broadcasting in background.
+    # Broadcasts are event-driven: the poll loop reports every tick (including
+    # the one that drops the connection) and API mutations request their own.
     polling_task = asyncio.create_task(simconnect.start_polling())
-    broadcast_task = asyncio.create_task(periodic_broadcast())
+    broadcaster_task = asyncio.create_task(websocket_manager.run_state_broadcaster())
 
     logger.info(f"Server running on http://{config.HOST}:{config.PORT}")
 
@@ -110,16 +133,34 @@ async def lifespan(app: FastAPI):
     # Cleanup
     logger.info("Shutting down...")
     await simconnect.stop_polling()
-    polling_task.cancel()
-    broadcast_task.cancel()
-    try:
-        await polling_task
-        await broadcast_task
-    except asyncio.CancelledError:
-        pass
+    await simbrief_client.close()
+    for task in (polling_task, broadcaster_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
 
-app = FastAPI(title="MSFS A320 Checklist Companion", lifespan=lifespan)
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+
+    Defined here rather than using fastapi.responses.ORJSONResponse, which
+    newer FastAPI releases deprecate. Read endpoints return it directly so
+    FastAPI skips its jsonable_encoder pass over the payload.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(
+    title="MSFS A320 Checklist Companion",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+# Compress pages, static assets and checklist JSON; WebSocket traffic is unaffected
+app.add_middleware(GZipMiddleware, minimum_size=config.GZIP_MIN_SIZE, compresslevel=5)
 
 
 # Pydantic models for API
@@ -140,19 +181,31 @@ class SettingsRequest(BaseModel):
 
 # REST API endpoints
 @app.get("/api/state")
-async def get_state():
+async def get_state(request: Request):
     """Get current flight state and checklist state."""
-    return {
+    # Both versions only move on real changes, so polling an idle app gets 304s
+    etag = (
+        f'W/"{STATE_ETAG_PREFIX}-{int(simconnect.connected)}'
+        f'-{simconnect.state_version}-{checklist_manager.state_version}"'
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse({
         "connected": simconnect.connected,
-        "flight_state": simconnect.state.model_dump() if simconnect.connected else None,
+        "flight_state": simconnect.get_state_dict() if simconnect.connected else None,
         **checklist_manager.get_state_dict(),
-    }
+    }, headers=headers)
 
 
 @app.get("/api/checklist")
-async def get_all_checklists():
+async def get_all_checklists(request: Request):
     """Get full checklist structure."""
-    return checklist_manager.get_all_checklists()
+    body, etag = checklist_manager.get_all_checklists_json()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/checklist/current")
@@ -160,7 +213,7 @@ async def get_current_checklist():
     """Get current active checklist."""
     checklist = checklist_manager.get_current_checklist()
     if checklist:
-        return checklist.to_dict()
+        return ORJSONResponse(checklist.to_dict())
     raise HTTPException(status_code=404, detail="No current checklist")
 
 
@@ -169,11 +222,7 @@ async def check_item(request: CheckItemRequest):
     """Mark item as checked."""
     success = checklist_manager.check_item(request.phase, request.item_id)
     if success:
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-        )
+        await broadcast_item_update(request.phase, request.item_id)
         return {"success": True}
     raise HTTPException(status_code=404, detail="Item not found")
 
@@ -183,11 +232,7 @@ async def uncheck_item(request: CheckItemRequest):
     """Mark item as unchecked."""
     success = checklist_manager.uncheck_item(request.phase, request.item_id)
     if success:
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-        )
+        await broadcast_item_update(request.phase, request.item_id)
         return {"success": True}
     raise HTTPException(status_code=404, detail="Item not found")
 
@@ -197,11 +242,7 @@ async def toggle_item(request: CheckItemRequest):
     """Toggle item checked state."""
     success = checklist_manager.toggle_item(request.phase, request.item_id)
     if success:
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-        )
+        await broadcast_item_update(request.phase, request.item_id)
         return {"success": True}
     raise HTTPException(status_code=404, detail="Item not found")
 
@@ -211,11 +252,7 @@ async def next_phase():
     """Force move to next phase."""
     success = checklist_manager.next_phase()
     if success:
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-        )
+        websocket_manager.request_state_update()
         return {"success": True, "phase": checklist_manager.current_phase.value}
     raise HTTPException(status_code=400, detail="No next phase available")
 
@@ -225,11 +262,7 @@ async def prev_phase():
     """Force move to previous phase."""
     success = checklist_manager.prev_phase()
     if success:
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-        )
+        websocket_manager.request_state_update()
         return {"success": True, "phase": checklist_manager.current_phase.value}
     raise HTTPException(status_code=400, detail="No previous phase available")
 
@@ -241,11 +274,7 @@ async def set_phase(request: SetPhaseRequest):
         phase = Phase(request.phase)
         checklist_manager.set_phase(phase)
         checklist_manager.phase_mode = "manual"
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-        )
+        websocket_manager.request_state_update()
         return {"success": True, "phase": phase.value}
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid phase")
@@ -256,11 +285,7 @@ async def reset_checklists():
     """Reset all checklists."""
     checklist_manager.reset_all()
     phase_detector.reset()
-    await websocket_manager.send_state_update(
-        connected=simconnect.connected,
-        flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-        checklist_state=checklist_manager.get_state_dict(),
-    )
+    websocket_manager.request_state_update()
     return {"success": True}
 
 
@@ -268,11 +293,7 @@ async def reset_checklists():
 async def set_auto_mode():
     """Set phase detection to auto mode."""
     checklist_manager.phase_mode = "auto"
-    await websocket_manager.send_state_update(
-        connected=simconnect.connected,
-        flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-        checklist_state=checklist_manager.get_state_dict(),
-    )
+    websocket_manager.request_state_update()
     return {"success": True, "mode": "auto"}
 
 
@@ -280,11 +301,7 @@ async def set_auto_mode():
 async def set_manual_mode():
     """Set phase detection to manual mode."""
     checklist_manager.phase_mode = "manual"
-    await websocket_manager.send_state_update(
-        connected=simconnect.connected,
-        flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-        checklist_state=checklist_manager.get_state_dict(),
-    )
+    websocket_manager.request_state_update()
     return {"success": True, "mode": "manual"}
 
 
@@ -292,7 +309,7 @@ async def set_manual_mode():
 @app.get("/api/settings")
 async def get_settings():
     """Get current settings."""
-    return settings_manager.settings.model_dump()
+    return ORJSONResponse(settings_manager.settings.model_dump())
 
 
 @app.post("/api/settings")
@@ -311,13 +328,7 @@ async def save_settings(request: SettingsRequest):
     if request.training_mode != old_training_mode:
         checklist_manager.set_training_mode(request.training_mode)
         # Broadcast updated state
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-            auto_transition=config.AUTO_PHASE_TRANSITION,
-            flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-        )
+        websocket_manager.request_state_update()
 
     return {"success": True, "settings": settings_manager.settings.model_dump()}
 
@@ -327,10 +338,10 @@ async def save_settings(request: SettingsRequest):
 async def get_flight_plan():
     """Get cached flight plan."""
     if simbrief_client.flight_plan:
-        return {
+        return ORJSONResponse({
             "success": True,
-            "flight_plan": simbrief_client.flight_plan.model_dump(),
-        }
+            "flight_plan": simbrief_client.flight_plan_dict,
+        })
     return {"success": False, "flight_plan": None, "message": "No flight plan loaded"}
 
 
@@ -348,15 +359,9 @@ async def fetch_flight_plan():
         checklist_manager.inject_flight_plan(flight_plan)
 
         # Broadcast updated state
-        await websocket_manager.send_state_update(
-            connected=simconnect.connected,
-            flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-            checklist_state=checklist_manager.get_state_dict(),
-            auto_transition=config.AUTO_PHASE_TRANSITION,
-            flight_plan=flight_plan.model_dump(),
-        )
+        websocket_manager.request_state_update()
 
-        return {"success": True, "flight_plan": flight_plan.model_dump()}
+        return {"success": True, "flight_plan": simbrief_client.flight_plan_dict}
 
     except SimBriefUserNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -372,17 +377,88 @@ async def clear_flight_plan():
     simbrief_client.clear_flight_plan()
     checklist_manager.clear_flight_plan_data()
 
-    await websocket_manager.send_state_update(
-        connected=simconnect.connected,
-        flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-        checklist_state=checklist_manager.get_state_dict(),
-        auto_transition=config.AUTO_PHASE_TRANSITION,
-        flight_plan=None,
-    )
+    websocket_manager.request_state_update()
 
     return {"success": True}
 
 
+# WebSocket message handlers. Each returns True if a full state update should follow.
+async def _ws_check_item(websocket: WebSocket, msg_data: dict) -> bool:
+    phase = msg_data.get("phase")
+    item_id = msg_data.get("item_id")
+    if not isinstance(phase, str) or not isinstance(item_id, str):
+        logger.warning(f"Invalid check_item message: phase={phase!r}, item_id={item_id!r}")
+        return False
+    if checklist_manager.toggle_item(phase, item_id):
+        await broadcast_item_update(phase, item_id)
+    else:
+        # Client is likely on a stale phase - resync it so its optimistic toggle is undone
+        await websocket_manager.send_state(websocket)
+    return False
+
+
+async def _ws_set_phase(websocket: WebSocket, msg_data: dict) -> bool:
+    try:
+        phase = Phase(msg_data.get("phase"))
+    except ValueError:
+        return False
+    checklist_manager.set_phase(phase)
+    # Sync the phase detector to this phase
+    phase_detector.sync_to_phase(phase)
+    # Check if this matches what detector would now detect
+    detected = phase_detector.detect(simconnect.state)
+    if phase == detected:
+        checklist_manager.phase_mode = "auto"
+    else:
+        checklist_manager.phase_mode = "manual"
+    return True
+
+
+def _sync_detector_to_current_phase():
+    """Sync the detector after manual navigation; resume auto mode if it agrees."""
+    phase_detector.sync_to_phase(checklist_manager.current_phase)
+    # Check if we landed on the auto-detected phase
+    detected = phase_detector.detect(simconnect.state)
+    if checklist_manager.current_phase == detected:
+        checklist_manager.phase_mode = "auto"
+
+
+async def _ws_next_phase(websocket: WebSocket, msg_data: dict) -> bool:
+    checklist_manager.next_phase()
+    _sync_detector_to_current_phase()
+    return True
+
+
+async def _ws_prev_phase(websocket: WebSocket, msg_data: dict) -> bool:
+    checklist_manager.prev_phase()
+    _sync_detector_to_current_phase()
+    return True
+
+
+async def _ws_reset(websocket: WebSocket, msg_data: dict) -> bool:
+    checklist_manager.reset_all()
+    phase_detector.reset()
+    return True
+
+
+async def _ws_set_mode(websocket: WebSocket, msg_data: dict) -> bool:
+    mode = msg_data.get("mode")
+    if mode not in ("auto", "manual"):
+        return False
+    checklist_manager.phase_mode = mode
+    return True
+
+
+_WS_HANDLERS: dict[str, Callable[[WebSocket, dict], Awaitable[bool]]] = {
+    "check_item": _ws_check_item,
+    "set_phase": _ws_set_phase,
+    "next_phase": _ws_next_phase,
+    "prev_phase": _ws_prev_phase,
+    "reset": _ws_reset,
+    "set_mode": _ws_set_mode,
+}
+
+
 # WebSocket endpoint
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -390,108 +466,15 @@ async def websocket_endpoint(websocket: WebSocket):
     await websocket_manager.connect(websocket)
 
     # Send initial state
-    await websocket.send_json({
-        "type": "state_update",
-        "data": {
-            "connected": simconnect.connected,
-            "flight_state": simconnect.state.model_dump() if simconnect.connected else None,
-            **checklist_manager.get_state_dict(),
-            "auto_transition": config.AUTO_PHASE_TRANSITION,
-            "flight_plan": simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-        }
-    })
+    await websocket_manager.send_state(websocket)
 
     try:
         while True:
-            data = await websocket.receive_json()
-            msg_type = data.get("type")
-            msg_data = data.get("data", {})
-
-            if msg_type == "check_item":
-                phase = msg_data.get("phase")
-                item_id = msg_data.get("item_id")
-                if not isinstance(phase, str) or not isinstance(item_id, str):
-                    logger.warning(f"Invalid check_item message: phase={phase!r}, item_id={item_id!r}")
-                    continue
-                checklist_manager.toggle_item(phase, item_id)
-                await websocket_manager.send_state_update(
-                    connected=simconnect.connected,
-                    flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-                    checklist_state=checklist_manager.get_state_dict(),
-                    flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-                )
-
-            elif msg_type == "set_phase":
-                try:
-                    phase = Phase(msg_data.get("phase"))
-                    checklist_manager.set_phase(phase)
-                    # Sync the phase detector to this phase
-                    phase_detector.sync_to_phase(phase)
-                    # Check if this matches what detector would now detect
-                    detected = phase_detector.detect(simconnect.state)
-                    if phase == detected:
-                        checklist_manager.phase_mode = "auto"
-                    else:
-                        checklist_manager.phase_mode = "manual"
-                    await websocket_manager.send_state_update(
-                        connected=simconnect.connected,
-                        flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-                        checklist_state=checklist_manager.get_state_dict(),
-                        flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-                    )
-                except ValueError:
-                    pass
-
-            elif msg_type == "next_phase":
-                checklist_manager.next_phase()
-                # Sync detector to new phase
-                phase_detector.sync_to_phase(checklist_manager.current_phase)
-                # Check if we landed on the auto-detected phase
-                detected = phase_detector.detect(simconnect.state)
-                if checklist_manager.current_phase == detected:
-                    checklist_manager.phase_mode = "auto"
-                await websocket_manager.send_state_update(
-                    connected=simconnect.connected,
-                    flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-                    checklist_state=checklist_manager.get_state_dict(),
-                    flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-                )
-
-            elif msg_type == "prev_phase":
-                checklist_manager.prev_phase()
-                # Sync detector to new phase
-                phase_detector.sync_to_phase(checklist_manager.current_phase)
-                # Check if we landed on the auto-detected phase
-                detected = phase_detector.detect(simconnect.state)
-                if checklist_manager.current_phase == detected:
-                    checklist_manager.phase_mode = "auto"
-                await websocket_manager.send_state_update(
-                    connected=simconnect.connected,
-                    flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-                    checklist_state=checklist_manager.get_state_dict(),
-                    flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-                )
-
-            elif msg_type == "reset":
-                checklist_manager.reset_all()
-                phase_detector.reset()
-                await websocket_manager.send_state_update(
-                    connected=simconnect.connected,
-                    flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-                    checklist_state=checklist_manager.get_state_dict(),
-                    flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-                )
-
-            elif msg_type == "set_mode":
-                mode = msg_data.get("mode")
-                if mode in ("auto", "manual"):
-                    checklist_manager.phase_mode = mode
-                    await websocket_manager.send_state_update(
-                        connected=simconnect.connected,
-                        flight_state=simconnect.state.model_dump() if simconnect.connected else None,
-                        checklist_state=checklist_manager.get_state_dict(),
-                        flight_plan=simbrief_client.flight_plan.model_dump() if simbrief_client.flight_plan else None,
-                    )
+            # Clients send text frames; decode them with orjson rather than stdlib json
+            data = orjson.loads(await websocket.receive_text())
+            handler = _WS_HANDLERS.get(data.get("type"))
+            if handler and await handler(websocket, data.get("data", {})):
+                websocket_manager.request_state_update()
 
     except WebSocketDisconnect:
         await websocket_manager.disconnect(websocket)
@@ -500,23 +483,32 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket_manager.disconnect(websocket)
 
 
+class RevalidatingStaticFiles(StaticFiles):
+    """StaticFiles that tells browsers to revalidate before reusing a cached file.
+
+    Asset URLs are not versioned, so a max-age could keep a stale app.js after an
+    update. With no-cache the browser still keeps the file but sends If-None-Match,
+    which StaticFiles answers with an empty 304 while the file is unchanged.
+    """
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "no-cache")
+        return response
+
+
 # Serve frontend static files
-app.mount("/static", StaticFiles(directory=str(config.FRONTEND_DIR)), name="static")
+app.mount("/static", RevalidatingStaticFiles(directory=str(config.FRONTEND_DIR)), name="static")
 
 
 @app.get("/api/network-info")
 async def get_network_info():
     """Get network information for QR code generation."""
-    import socket
-    try:
-        # Get local IP by connecting to an external address (doesn't actually connect)
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(2)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-    except Exception:
-        local_ip = "localhost"
+    local_ip = app.state.local_ip
+    if local_ip == "localhost":
+        # No network at startup - try again without blocking the event loop
+        local_ip = await asyncio.get_running_loop().run_in_executor(None, get_local_ip)
+        app.state.local_ip = local_ip
 
     return {
         "ip": local_ip,
@@ -525,19 +517,25 @@ async def get_network_info():
     }
 
 
+# Page files, resolved once rather than per request
+INDEX_PAGE = str(config.FRONTEND_DIR / "index.html")
+WELCOME_PAGE = str(config.FRONTEND_DIR / "welcome.html")
+SETTINGS_PAGE = str(config.FRONTEND_DIR / "settings.html")
+
+
 @app.get("/")
 async def serve_frontend():
     """Serve the frontend."""
-    return FileResponse(config.FRONTEND_DIR / "index.html")
+    return FileResponse(INDEX_PAGE)
 
 
 @app.get("/welcome")
 async def serve_welcome():
     """Serve the welcome/startup page."""
-    return FileResponse(config.FRONTEND_DIR / "welcome.html")
+    return FileResponse(WELCOME_PAGE)
 
 
 @app.get("/settings")
 async def serve_settings():
     """Serve the settings page."""
-    return FileResponse(config.FRONTEND_DIR / "settings.html")
+    return FileResponse(SETTINGS_PAGE)
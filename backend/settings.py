@@ -1,12 +1,13 @@
 """Persistent settings storage for the checklist companion."""
 
-import json
 import logging
+import os
 import threading
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict
 
 from .config import config
 
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 class Settings(BaseModel):
     """Application settings model."""
 
+    # Immutable so one instance can be shared with readers; updates build a new one
+    model_config = ConfigDict(frozen=True)
+
     simbrief_username: str = ""
     dark_mode: bool = False
     training_mode: bool = False
@@ -35,8 +39,7 @@ class SettingsManager:
         with self._lock:
             try:
                 if self._settings_file.exists():
-                    with open(self._settings_file, "r") as f:
-                        data = json.load(f)
+                    data = orjson.loads(self._settings_file.read_bytes())
                     self._settings = Settings(**data)
                     logger.info(f"Settings loaded from {self._settings_file}")
                 else:
@@ -50,8 +53,12 @@ class SettingsManager:
         with self._lock:
             try:
                 self._settings_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(self._settings_file, "w") as f:
-                    json.dump(self._settings.model_dump(), f, indent=2)
+                payload = orjson.dumps(self._settings.model_dump(), option=orjson.OPT_INDENT_2)
+                # Write a sibling temp file and swap it in, so an interrupted save
+                # never leaves a truncated settings file behind
+                tmp_file = self._settings_file.with_name(self._settings_file.name + ".tmp")
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, self._settings_file)
                 logger.info(f"Settings saved to {self._settings_file}")
             except Exception as e:
                 logger.error(f"Failed to save settings: {e}")
@@ -59,23 +66,20 @@ class SettingsManager:
 
     @property
     def settings(self) -> Settings:
-        """Get current settings."""
-        with self._lock:
-            return self._settings.model_copy()
+        """Get current settings. Lock-free: the frozen instance is swapped, never mutated."""
+        return self._settings
 
     def update(self, **kwargs) -> Settings:
         """Update settings and persist to file."""
         with self._lock:
-            data = self._settings.model_dump()
-            data.update(kwargs)
-            self._settings = Settings(**data)
+            # Values come from validated request models; skip re-validating every field
+            self._settings = self._settings.model_copy(update=kwargs)
         self._save()
         return self.settings
 
     def get_simbrief_username(self) -> str:
         """Get SimBrief username."""
-        with self._lock:
-            return self._settings.simbrief_username
+        return self._settings.simbrief_username
 
     def set_simbrief_username(self, username: str):
         """Set SimBrief username."""
@@ -5,12 +5,17 @@ import re
 from typing import Optional
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 SIMBRIEF_API_URL = "https://www.simbrief.com/api/xml.fetcher.php"
 
+# METAR altimeter groups: Q1013 (hPa) and A2992 (hundredths of inHg)
+QNH_HPA_RE = re.compile(r"Q(\d{4})")
+QNH_INHG_RE = re.compile(r"A(\d{4})")
+
 
 class FlightPlan(BaseModel):
     """Parsed flight plan data from SimBrief OFP."""
@@ -80,15 +85,35 @@ class SimBriefClient:
 
     def __init__(self):
         self._flight_plan: Optional[FlightPlan] = None
+        self._flight_plan_dict: Optional[dict] = None
+        self._http: Optional[httpx.AsyncClient] = None
 
     @property
     def flight_plan(self) -> Optional[FlightPlan]:
         """Get the cached flight plan."""
         return self._flight_plan
 
+    @property
+    def flight_plan_dict(self) -> Optional[dict]:
+        """Get the cached flight plan as a dict (dumped once per fetch)."""
+        return self._flight_plan_dict
+
     def clear_flight_plan(self):
         """Clear the cached flight plan."""
         self._flight_plan = None
+        self._flight_plan_dict = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, so repeat fetches reuse the kept-alive connection."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=10.0)
+        return self._http
+
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def fetch_flight_plan(self, username: str) -> FlightPlan:
         """
@@ -109,13 +134,12 @@ class SimBriefClient:
             raise SimBriefError("Username is required")
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    SIMBRIEF_API_URL,
-                    params={"username": username, "json": "1"},
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._get_http_client().get(
+                SIMBRIEF_API_URL,
+                params={"username": username, "json": "1"},
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
         except httpx.TimeoutException:
             raise SimBriefNetworkError("Request timed out")
@@ -139,6 +163,7 @@ class SimBriefClient:
         try:
             flight_plan = self._parse_ofp(data)
             self._flight_plan = flight_plan
+            self._flight_plan_dict = flight_plan.model_dump()
             logger.info(
                 f"Flight plan fetched: {flight_plan.origin} -> {flight_plan.destination}"
             )
@@ -228,15 +253,14 @@ class SimBriefClient:
 
         # Look for Q#### (hPa) or A#### (inHg)
         # QNH in hPa (e.g., Q1013)
-        match = re.search(r"Q(\d{4})", metar)
+        match = QNH_HPA_RE.search(metar)
         if match:
             return int(match.group(1))
 
-        # QNH in inHg (e.g., A2992) - convert to hPa
-        match = re.search(r"A(\d{4})", metar)
+        # QNH in inHg (e.g., A2992) - convert to hPa (1 inHg = 33.8639 hPa) in integer math
+        match = QNH_INHG_RE.search(metar)
         if match:
-            inhg = int(match.group(1)) / 100.0
-            return int(inhg * 33.8639)
+            return int(match.group(1)) * 338639 // 1000000
 
         return 0
 
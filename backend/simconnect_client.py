@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Optional, Callable, Any
+from operator import attrgetter
+from typing import Optional, Callable, Any, Iterable
 
 from .flight_state import FlightState, N1_RPM_SCALE, N1_RUNNING_THRESHOLD
 from .config import config
@@ -58,6 +59,72 @@ SIMCONNECT_VARS = {
 # Conversion factors
 GAL_TO_KG = 3.03  # Jet fuel (Jet-A) gallons to kg (approx 6.7 lbs/gal * 0.453)
 
+# FlightState attributes read as 0/1 flags
+BOOL_ATTRS = frozenset({
+    "sim_on_ground", "gear_handle_position", "spoilers_armed", "parking_brake",
+    "eng1_combustion", "eng2_combustion",
+    "light_beacon", "light_nav", "light_landing", "light_taxi", "light_strobe",
+    "autopilot_master", "seatbelt_sign", "no_smoking_sign",
+    "apu_gen_switch", "master_battery",
+})
+
+# Attributes stored under another name or unit: attr -> (FlightState attr, converter)
+VALUE_CONVERSIONS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "fuel_total_gal": ("fuel_total_kg", lambda gal: gal * GAL_TO_KG),
+    "altimeter_hpa": ("altimeter_hpa", lambda hpa: int(round(hpa))),  # Integer hPa
+}
+
+
+def _engine_running(state: FlightState, engine: int) -> bool:
+    """Check if an engine is running using multiple detection methods."""
+    if engine == 1:
+        n1_pct = state.eng1_n1
+        n1_rpm = state.eng1_n1_rpm / N1_RPM_SCALE if state.eng1_n1_rpm else 0
+        combustion = state.eng1_combustion
+    else:
+        n1_pct = state.eng2_n1
+        n1_rpm = state.eng2_n1_rpm / N1_RPM_SCALE if state.eng2_n1_rpm else 0
+        combustion = state.eng2_combustion
+    return max(n1_pct, n1_rpm) > N1_RUNNING_THRESHOLD or combustion
+
+
+def _engines_running(state: FlightState, both: bool = False) -> bool:
+    """Check if engines are running (both or any)."""
+    if both:
+        return _engine_running(state, 1) and _engine_running(state, 2)
+    return _engine_running(state, 1) or _engine_running(state, 2)
+
+
+# SimConnect variable name -> value derived from the current state (checklist verification)
+VARIABLE_GETTERS: dict[str, Callable[[FlightState], Any]] = {
+    # Parking brake
+    "BRAKE_PARKING_POSITION": attrgetter("parking_brake"),
+    # Beacon
+    "LIGHT_BEACON": attrgetter("light_beacon"),
+    # Flight controls
+    "TRAILING_EDGE_FLAPS_LEFT_PERCENT": attrgetter("flaps_percent"),
+    "SPOILERS_ARMED": attrgetter("spoilers_armed"),
+    "GEAR_HANDLE_POSITION": attrgetter("gear_handle_position"),
+    # Lights
+    "LIGHT_NAV": attrgetter("light_nav"),
+    "LIGHT_LANDING": attrgetter("light_landing"),
+    "LIGHT_TAXI": attrgetter("light_taxi"),
+    "LIGHT_STROBE": attrgetter("light_strobe"),
+    # Cabin signs
+    "CABIN_SEATBELTS_ALERT_SWITCH": attrgetter("seatbelt_sign"),
+    "CABIN_NO_SMOKING_ALERT_SWITCH": attrgetter("no_smoking_sign"),
+    # APU - running if RPM > 0
+    "APU_SWITCH": lambda state: state.apu_pct_rpm > 0,
+    "APU_GENERATOR_SWITCH": attrgetter("apu_gen_switch"),
+    # Trim
+    "RUDDER_TRIM_PCT": attrgetter("rudder_trim_pct"),
+    # Engines - use multiple detection methods
+    "ENG_COMBUSTION": lambda state: _engines_running(state, both=True),
+    "ENG_COMBUSTION_ANY": lambda state: _engines_running(state, both=False),
+    # Electrical
+    "ELECTRICAL_MASTER_BATTERY": attrgetter("master_battery"),
+}
+
 
 class SimConnectClient:
     """Manages connection to MSFS via SimConnect."""
@@ -65,9 +132,13 @@ class SimConnectClient:
     def __init__(self):
         self._sc = None
         self._aq = None
+        # (Request, FlightState attr, converter), resolved per connection
+        self._requests: list[tuple[Any, str, Optional[Callable[[Any], Any]]]] = []
         self._connected = False
         self._running = False
         self._state = FlightState()
+        self._state_version = 0  # Bumped whenever a polled value changes
+        self._state_dict_cache: Optional[tuple[int, dict]] = None
         self._state_callback: Optional[Callable[[FlightState], Any]] = None
         self._poll_task: Optional[asyncio.Task] = None
 
@@ -79,6 +150,18 @@ class SimConnectClient:
     def state(self) -> FlightState:
         return self._state
 
+    @property
+    def state_version(self) -> int:
+        return self._state_version
+
+    def get_state_dict(self) -> dict:
+        """Get the current state as a dict, reused until a polled value changes."""
+        cache = self._state_dict_cache
+        if cache is None or cache[0] != self._state_version:
+            cache = (self._state_version, self._state.to_dict())
+            self._state_dict_cache = cache
+        return cache[1]
+
     def set_state_callback(self, callback: Callable[[FlightState], Any]):
         """Set callback to be called when state updates."""
         self._state_callback = callback
@@ -94,6 +177,7 @@ class SimConnectClient:
 
             self._sc = SimConnect()
             self._aq = AircraftRequests(self._sc, _time=0)
+            self._requests = self._build_requests()
             self._connected = True
             logger.info("Connected to SimConnect")
             return True
@@ -102,6 +186,7 @@ class SimConnectClient:
             self._connected = False
             self._sc = None
             self._aq = None
+            self._requests = []
             return False
 
     def disconnect(self):
@@ -113,9 +198,39 @@ class SimConnectClient:
                 pass
         self._sc = None
         self._aq = None
+        self._requests = []
         self._connected = False
         logger.info("Disconnected from SimConnect")
 
+    def _build_requests(self) -> list[tuple[Any, str, Optional[Callable[[Any], Any]]]]:
+        """Resolve one Request per SimConnect variable, once per connection.
+
+        AircraftRequests shares a single Request between all indices of an indexed
+        variable and re-registers its data definition whenever the index changes,
+        so indexed variables (engine 1/2) each get a dedicated Request instead.
+        """
+        from SimConnect import Request
+
+        requests = []
+        for sc_var, attr_name in SIMCONNECT_VARS.items():
+            name, _, index = sc_var.partition(":")
+            request = None
+            if not index:
+                request = self._aq.find(sc_var)
+            else:
+                for group in self._aq.list:
+                    entry = group.list.get(f"{name}:index")
+                    if entry:
+                        definition = entry[1].replace(b":index", f":{index}".encode())
+                        request = Request((definition, entry[2]), self._sc, _time=0, _dec=entry[0])
+                        break
+            if request is None:
+                logger.warning(f"Unknown SimConnect variable: {sc_var}")
+                continue
+            default = (attr_name, bool if attr_name in BOOL_ATTRS else None)
+            requests.append((request, *VALUE_CONVERSIONS.get(attr_name, default)))
+        return requests
+
     def _poll_state(self) -> FlightState:
         """Poll current state from SimConnect."""
         if not self._connected or not self._aq:
@@ -124,31 +239,18 @@ class SimConnectClient:
         try:
             state_dict = {}
 
-            for sc_var, attr_name in SIMCONNECT_VARS.items():
+            for request, attr_name, convert in self._requests:
                 try:
-                    value = self._aq.get(sc_var)
+                    value = request.value
                     if value is not None:
-                        # Convert boolean values
-                        if attr_name in ("sim_on_ground", "gear_handle_position",
-                                        "spoilers_armed", "parking_brake",
-                                        "eng1_combustion", "eng2_combustion",
-                                        "light_beacon", "light_nav", "light_landing",
-                                        "light_taxi", "light_strobe", "autopilot_master",
-                                        "seatbelt_sign", "no_smoking_sign",
-                                        "apu_gen_switch", "master_battery"):
-                            value = bool(value)
-                        # Convert fuel from gallons to kg
-                        elif attr_name == "fuel_total_gal":
-                            state_dict["fuel_total_kg"] = value * GAL_TO_KG
-                            continue
-                        # Round altimeter to integer hPa
-                        elif attr_name == "altimeter_hpa":
-                            value = int(round(value))
-                        state_dict[attr_name] = value
+                        state_dict[attr_name] = convert(value) if convert else value
                 except Exception as e:
-                    logger.debug(f"Error reading {sc_var}: {e}")
+                    logger.debug(f"Error reading {attr_name}: {e}")
 
-            self._state = FlightState(**state_dict)
+            state = FlightState(**state_dict)
+            if state != self._state:
+                self._state = state
+                self._state_version += 1
             return self._state
 
         except Exception as e:
@@ -197,52 +299,19 @@ class SimConnectClient:
                 pass
         self.disconnect()
 
-    def _engine_running(self, engine: int) -> bool:
-        """Check if an engine is running using multiple detection methods."""
-        if engine == 1:
-            n1_pct = self._state.eng1_n1
-            n1_rpm = self._state.eng1_n1_rpm / N1_RPM_SCALE if self._state.eng1_n1_rpm else 0
-            combustion = self._state.eng1_combustion
-        else:
-            n1_pct = self._state.eng2_n1
-            n1_rpm = self._state.eng2_n1_rpm / N1_RPM_SCALE if self._state.eng2_n1_rpm else 0
-            combustion = self._state.eng2_combustion
-        return max(n1_pct, n1_rpm) > N1_RUNNING_THRESHOLD or combustion
-
-    def _engines_running(self, both: bool = False) -> bool:
-        """Check if engines are running (both or any)."""
-        if both:
-            return self._engine_running(1) and self._engine_running(2)
-        return self._engine_running(1) or self._engine_running(2)
-
     def get_variable(self, var_name: str) -> Any:
         """Get a specific SimConnect variable value from current state."""
-        var_map = {
-            # Parking brake
-            "BRAKE_PARKING_POSITION": self._state.parking_brake,
-            # Beacon
-            "LIGHT_BEACON": self._state.light_beacon,
-            # Flight controls
-            "TRAILING_EDGE_FLAPS_LEFT_PERCENT": self._state.flaps_percent,
-            "SPOILERS_ARMED": self._state.spoilers_armed,
-            "GEAR_HANDLE_POSITION": self._state.gear_handle_position,
-            # Lights
-            "LIGHT_NAV": self._state.light_nav,
-            "LIGHT_LANDING": self._state.light_landing,
-            "LIGHT_TAXI": self._state.light_taxi,
-            "LIGHT_STROBE": self._state.light_strobe,
-            # Cabin signs
-            "CABIN_SEATBELTS_ALERT_SWITCH": self._state.seatbelt_sign,
-            "CABIN_NO_SMOKING_ALERT_SWITCH": self._state.no_smoking_sign,
-            # APU - running if RPM > 0
-            "APU_SWITCH": self._state.apu_pct_rpm > 0,
-            "APU_GENERATOR_SWITCH": self._state.apu_gen_switch,
-            # Trim
-            "RUDDER_TRIM_PCT": self._state.rudder_trim_pct,
-            # Engines - use multiple detection methods
-            "ENG_COMBUSTION": self._engines_running(both=True),
-            "ENG_COMBUSTION_ANY": self._engines_running(both=False),
-            # Electrical
-            "ELECTRICAL_MASTER_BATTERY": self._state.master_battery,
-        }
-        return var_map.get(var_name)
+        getter = VARIABLE_GETTERS.get(var_name)
+        return getter(self._state) if getter else None
+
+    def get_variables(self, var_names: Iterable[str]) -> dict[str, Any]:
+        """Get several SimConnect variable values at once, skipping unknown/unset ones."""
+        state = self._state
+        values = {}
+        for var_name in var_names:
+            getter = VARIABLE_GETTERS.get(var_name)
+            if getter is not None:
+                value = getter(state)
+                if value is not None:
+                    values[var_name] = value
+        return values
@@ -1,8 +1,10 @@
 import asyncio
-import json
+import contextlib
 import logging
-from typing import Set
+import time
+from typing import Callable, Optional, Set
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -11,62 +13,147 @@ logger = logging.getLogger(__name__)
 class WebSocketManager:
     """Manages WebSocket connections to clients."""
 
+    # Send a full state frame (not just changed keys) at least this often (seconds)
+    _STATE_HEARTBEAT_INTERVAL = 5.0
+    # Minimum time between state broadcasts; requests in between are coalesced (seconds)
+    _STATE_BROADCAST_INTERVAL = 0.033
+    # A client that cannot take a frame within this time is closed (seconds)
+    _SEND_TIMEOUT = 2.0
+
     def __init__(self):
+        # Only touched from the event loop and never across an await, so no lock is needed
         self._connections: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self._last_state_data: Optional[dict] = None  # Last state every client holds
+        self._last_state_sent: float = 0.0
+        self._state_provider: Optional[Callable[[], dict]] = None
+        self._state_requested: Optional[asyncio.Event] = None  # Created by the broadcaster
+        self._close_tasks: Set[asyncio.Task] = set()  # Referenced until done so they are not GC'd
 
     async def connect(self, websocket: WebSocket):
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        async with self._lock:
-            self._connections.add(websocket)
-        logger.info(f"WebSocket connected. Total connections: {len(self._connections)}")
+        self._connections.add(websocket)
+        logger.info("WebSocket connected. Total connections: %d", len(self._connections))
 
     async def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        async with self._lock:
-            self._connections.discard(websocket)
-        logger.info(f"WebSocket disconnected. Total connections: {len(self._connections)}")
+        self._connections.discard(websocket)
+        logger.info("WebSocket disconnected. Total connections: %d", len(self._connections))
 
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected clients."""
         if not self._connections:
             return
 
-        message_json = json.dumps(message)
+        # Encode once, then fan the same frame out to every client
+        await self._send_to_all(orjson.dumps(message).decode())
+
+    async def _send_to_all(self, message_json: str):
+        """Send an encoded message to all connected clients."""
+        # Snapshot, since connections may come and go while the sends are awaited
+        connections = tuple(self._connections)
 
-        # Snapshot connections under lock, then send outside lock
-        async with self._lock:
-            connections = set(self._connections)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(connection.send_text(message_json), self._SEND_TIMEOUT)
+              for connection in connections),
+            return_exceptions=True,
+        )
 
         dead_connections = set()
-        for connection in connections:
-            try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to send to WebSocket: %r", result)
                 dead_connections.add(connection)
 
-        # Re-acquire lock to remove dead connections
         if dead_connections:
-            async with self._lock:
-                self._connections -= dead_connections
-
-    async def send_state_update(self, connected: bool, flight_state: dict | None,
-                                 checklist_state: dict, auto_transition: bool = True,
-                                 flight_plan: dict | None = None):
-        """Send a state update to all clients."""
-        message = {
-            "type": "state_update",
-            "data": {
-                "connected": connected,
-                "flight_state": flight_state,
-                "auto_transition": auto_transition,
-                "flight_plan": flight_plan,
-                **checklist_state,
+            self._connections -= dead_connections
+            for connection in dead_connections:
+                task = asyncio.create_task(self._close(connection))
+                self._close_tasks.add(task)
+                task.add_done_callback(self._close_tasks.discard)
+
+    async def _close(self, websocket: WebSocket):
+        """Close a client that missed a frame, so it reconnects and gets a full state."""
+        # The socket may already be gone, or wedged by a send cut off mid-frame
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(websocket.close(code=1011), self._SEND_TIMEOUT)
+
+    def set_state_provider(self, provider: Callable[[], dict]):
+        """Set the function that builds the data of a state_update message."""
+        self._state_provider = provider
+
+    def request_state_update(self):
+        """Schedule a state broadcast. Requests made before it runs collapse into one."""
+        if self._state_requested:
+            self._state_requested.set()
+
+    async def run_state_broadcaster(self):
+        """Broadcast the latest state whenever requested, rate-limited to one send per interval."""
+        # Bind the event to the running loop
+        self._state_requested = asyncio.Event()
+        while True:
+            await self._state_requested.wait()
+            self._state_requested.clear()
+            try:
+                await self.send_state_update()
+            except Exception as e:
+                logger.error(f"State broadcast error: {e}", exc_info=True)
+            await asyncio.sleep(self._STATE_BROADCAST_INTERVAL)
+
+    async def send_state_update(self):
+        """Send the state to all clients immediately, as the top-level keys that changed.
+
+        Clients merge state_update data into the state they hold, so unchanged keys
+        are left out. A full frame goes out when there is no baseline yet and at
+        least once per heartbeat interval.
+        """
+        if not self._state_provider:
+            return
+        if not self._connections:
+            # Nobody saw this change, so the last state no longer reflects the clients
+            self._last_state_data = None
+            return
+        data = self._state_provider()
+
+        last = self._last_state_data
+        now = time.monotonic()
+        if last is None or now - self._last_state_sent >= self._STATE_HEARTBEAT_INTERVAL:
+            changes = data
+        else:
+            changes = {
+                key: value for key, value in data.items()
+                if key not in last or (value is not last[key] and value != last[key])
             }
-        }
-        await self.broadcast(message)
+            if not changes:
+                return
+        self._last_state_data = data
+        self._last_state_sent = now
+
+        await self._send_to_all(orjson.dumps({"type": "state_update", "data": changes}).decode())
+
+    async def send_state(self, websocket: WebSocket):
+        """Send the full state to one client, matching the baseline later changes build on.
+
+        Uses the last broadcast state when there is one; a state that is behind by
+        a pending request is corrected by the broadcast that follows. The frame is
+        flagged as a resync so the client re-renders even if state_version is
+        unchanged, undoing any optimistic update the server did not apply.
+        """
+        data = self._last_state_data
+        if data is None:
+            data = self._state_provider()
+        await websocket.send_text(
+            orjson.dumps({"type": "state_update", "data": data, "resync": True}).decode()
+        )
+
+    async def send_item_update(self, phase: str, item_id: str, checked: bool):
+        """Send a single item's checked state to all clients."""
+        # The baseline now has a stale item; the next broadcast sends a full frame
+        self._last_state_data = None
+        await self.broadcast({
+            "type": "item_update",
+            "data": {"phase": phase, "item_id": item_id, "checked": checked},
+        })
 
     @property
     def connection_count(self) -> int:
@@ -20,54 +20,55 @@ from backend.main import app as fastapi_app
 def get_local_ip():
     """Get the local network IP address."""
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(2)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(2)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
     except Exception:
         return "localhost"
 
 
-def run_server():
+def create_server():
+    """Create the uvicorn server for the FastAPI app."""
+    return uvicorn.Server(uvicorn.Config(
+        fastapi_app,
+        host=config.HOST,
+        port=config.PORT,
+        log_level="warning",  # Quieter logging for desktop app
+        ws_max_size=config.WS_MAX_SIZE,
+    ))
+
+
+def run_server(server):
     """Run the FastAPI server in a background thread."""
     try:
-        uvicorn.run(
-            fastapi_app,
-            host=config.HOST,
-            port=config.PORT,
-            log_level="warning",  # Quieter logging for desktop app
-        )
+        server.run()
     except OSError as e:
         print(f"Error: Could not start server on port {config.PORT}.")
         print(f"  Another instance may already be running. ({e})")
         sys.exit(1)
 
 
-def wait_for_server(timeout=10):
-    """Wait for the server to be ready."""
-    import urllib.request
-    import urllib.error
-
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            urllib.request.urlopen(f"http://localhost:{config.PORT}/api/state", timeout=1)
-            return True
-        except (urllib.error.URLError, ConnectionRefusedError):
-            time.sleep(0.1)
-    return False
+def wait_for_server(server, server_thread, timeout=10):
+    """Wait for uvicorn to finish startup. Returns False if it exits or times out first."""
+    deadline = time.monotonic() + timeout
+    while not server.started:
+        if not server_thread.is_alive() or time.monotonic() > deadline:
+            return False
+        # Wakes early if the server thread dies (e.g. port already in use)
+        server_thread.join(0.05)
+    return True
 
 
 def main():
     # Start the server in a background thread
-    server_thread = threading.Thread(target=run_server, daemon=True)
+    server = create_server()
+    server_thread = threading.Thread(target=run_server, args=(server,), daemon=True)
     server_thread.start()
 
     # Wait for server to be ready
     print("Starting A320 Checklist Companion...")
-    if not wait_for_server():
+    if not wait_for_server(server, server_thread):
         print("Error: Server failed to start")
         sys.exit(1)
 
@@ -99,11 +99,26 @@ class ChecklistApp {
 
     handleMessage(message) {
         if (message.type === 'state_update') {
-            this.updateState(message.data);
+            this.updateState(message.data, message.resync === true);
+        } else if (message.type === 'item_update') {
+            this.applyItemUpdate(message.data);
         }
     }
 
-    updateState(data) {
+    applyItemUpdate(data) {
+        // Only the current checklist is held client-side; other phases
+        // arrive with the next state_update
+        const { checklist, phase } = this.state;
+        if (!checklist || data.phase !== phase) return;
+
+        const item = checklist.items.find(i => i.id === data.item_id);
+        if (item) {
+            item.checked = data.checked;
+            this.renderChecklist();
+        }
+    }
+
+    updateState(data, resync = false) {
         const prevPhase = this.state.phase;
         const prevVersion = this._lastStateVersion;
 
@@ -114,8 +129,9 @@ class ChecklistApp {
         const checklistChanged = newVersion !== prevVersion || prevPhase !== this.state.phase;
         this._lastStateVersion = newVersion;
 
-        // After reconnect, force a full re-render to reconcile any optimistic UI divergence
-        const forceFullRender = this._justReconnected;
+        // After reconnect or a server resync, force a full re-render to reconcile
+        // any optimistic UI divergence (e.g. a toggle the server rejected)
+        const forceFullRender = this._justReconnected || resync;
         this._justReconnected = false;
 
         this.renderConnectionStatus();
@@ -31,6 +31,7 @@ def main():
         port=config.PORT,
         reload=False,
         log_level="info",
+        ws_max_size=config.WS_MAX_SIZE,
     )
 
 
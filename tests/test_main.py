@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from backend.main import app, checklist_manager
+
+
+def test_failed_toggle_resyncs_sender():
+    with TestClient(app) as client, client.websocket_connect("/ws") as ws:
+        assert ws.receive_json()["type"] == "state_update"
+        version = checklist_manager.state_version
+
+        ws.send_json({
+            "type": "check_item",
+            "data": {"phase": checklist_manager.current_phase.value, "item_id": "no_such_item"},
+        })
+        message = ws.receive_json()
+
+        assert message["type"] == "state_update"
+        assert message["resync"] is True
+        assert message["data"]["state_version"] == version
+
+
+def test_mode_change_invalidates_state_etag():
+    with TestClient(app) as client:
+        client.post("/api/mode/auto")
+        etag = client.get("/api/state").headers["etag"]
+        assert client.get("/api/state", headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/api/mode/manual")
+        response = client.get("/api/state", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["phase_mode"] == "manual"
+        assert response.headers["etag"] != etag
@@ -0,0 +1,29 @@
+import asyncio
+
+from backend.websocket_manager import WebSocketManager
+
+
+class FailingWebSocket:
+    def __init__(self):
+        self.close_code = None
+
+    async def send_text(self, data: str):
+        raise RuntimeError("connection lost")
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+
+def test_failed_send_closes_client():
+    async def run():
+        manager = WebSocketManager()
+        websocket = FailingWebSocket()
+        manager._connections.add(websocket)
+
+        await manager.broadcast({"type": "ping"})
+        await asyncio.gather(*manager._close_tasks)  # Let the scheduled close run
+
+        assert manager.connection_count == 0
+        assert websocket.close_code == 1011
+
+    asyncio.run(run())